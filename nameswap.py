@@ -9,9 +9,25 @@ import csv
 import random
 import json
 import os
-from typing import Dict,Set,TextIO
+import functools
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict,Iterator,Optional,Set,TextIO
 from textwrap import dedent
-from faker import Faker
+
+#Characters that separate name parts within a cell ("First Last", "Last, First", "Hyphen-ated")
+#splitting_strings = ["jr","sr",del] #FUTURE - also exempt strings like titles and connecting words? # Not needed for my use case and may expose unique name formats
+SPLITTING_CHARACTERS = [' ','-','–','—',',']
+
+#Precompiled splitter. The capturing group keeps separators in the output, so split results alternate name part, separator, name part...
+_SPLIT_RE = re.compile("([" + re.escape("".join(SPLITTING_CHARACTERS)) + "])")
+
+#Buffer size for CSV file handles
+IO_BUFFER_SIZE = 1 << 20
+
+#Characters read from the start of each file for dialect detection
+DIALECT_SAMPLE_SIZE = 1024
 
 #Help text for command line usage
 HELP_TEXT = dedent("""
@@ -36,6 +52,7 @@ MENU_TEXT = dedent("""
         [-p <prefix>] - optionally specify the prefix for renamed files. defaults to 'renamed-')
         [-s <seed>]   - optionally specify a seed for deterministic mappings. (same inputs with same seed yield same outputs)
         [-m <mappingfile>] - optionally specify a path to a mapping session file to load and/or save mappings across sessions. (should be .json format)
+        [-d <dialect>] - optionally write every file in a named csv dialect (excel, excel-tab, unix), skipping per-file dialect detection. defaults to 'sniff'
 
     Option flags:
         [--help]             - display basic help information
@@ -43,11 +60,24 @@ MENU_TEXT = dedent("""
         [--skip]             - skip confirmation step before processing (use with caution)
         [--defaultcolumns]   - apply default columns if none were specified
         [--renamewholecells] - apply renaming to entire cells, instead of splitting by spaces and commas. (use with caution)
-        [--warnmaxattempts]  - warn if max attempts to generate unique names is reached (may indicate high name collision rate)
+        [--warnmaxattempts]  - warn when every name in the pool is used and numbers are added to keep names unique
+        [--parallel]         - process files in parallel worker processes, after a serial pass that assigns all names in order (needs more than one CPU)
+        [--fastcsv]          - use a byte-level fast path for simple comma separated files, falling back to normal parsing if a file uses quotes
+        [--minimalquoting]   - only quote output fields that need it, instead of quoting every field when the input uses quotes
 
         see documentation for more details on each flag and option, especially -s and --renamewholecells
 """)
 
+@functools.lru_cache(maxsize=None)
+def _shared_first_names(locale:str = "en_US") -> tuple:
+    """ Returns the distinct first names from Faker's person provider for the given locale, loaded once per process and shared by every Renamer."""
+    #Faker is imported lazily, on first use, so --help, --menu and failed validation exit without paying for its import.
+    #Importing the provider still runs faker/__init__, loading around 48 faker modules (roughly 90-140ms), so the saving is only for runs that never draw a name
+    #Drawing from this tuple directly skips the per-call provider dispatch and weighted selection of Faker.first_name()
+    from importlib import import_module
+    provider = import_module(f"faker.providers.person.{locale}").Provider
+    return tuple(dict.fromkeys(provider.first_names))
+
 class SessionManager:
     """Provide a save/load layer for continuous use of a mapping set across sessions."""
     
@@ -57,7 +87,6 @@ class SessionManager:
         session_data = {
             "config": {
                 "seed" : renamer.seed,
-                #"max_attempts" : renamer.max_attempts,# Since this isn't modifiable by the user yet, I dont think saving it is neccessary. if it becomes modifiable, it should absolutely be saved here
                 "rename_whole_cells" : config.rename_whole_cells
             },
             "mappings" : renamer.mappings
@@ -74,7 +103,8 @@ class SessionManager:
         
         try:
             with open(output_path, 'w', encoding='utf-8') as outfile:
-                json.dump(session_data, outfile, indent=2, ensure_ascii=False)
+                #Encoding to one string and writing once is faster than json.dump, which streams through many small writes
+                outfile.write(json.dumps(session_data, indent=2, ensure_ascii=False))
                 return True
         except PermissionError:
             print(f"Error: Permission denied, cannot save to: {output_path}")
@@ -104,22 +134,22 @@ class SessionManager:
 class Renamer:
     """ Renamer class for generating and storing safe names """
 
-    def __init__(self, _seed, _max_attempts: int = 25, _warn_on_max_attempts: bool = False,_prior_mappings:Dict[str,str]=None):
+    def __init__(self, _seed, _warn_on_max_attempts: bool = False,_prior_mappings:Dict[str,str]=None):
         """ Initializes the Renamer, with optional settings.
         
-        Public Method: 
+        Public Methods: 
             get_safe_name(original:str) - given a name string, returns a unique mapping to swap with
+            merge_mappings(other_mappings:dict) - adds mappings made elsewhere (ie by a worker process) without overwriting existing ones
 
         Args:
             seed (str): optional string for deterministic generation
-            max_attempts (int, optional): Number of attempted renamings before numbers are added to ensure a unique name. Defaults to 25.
-            warn_on_max_attempts (bool, optional): _description_. Decides if user should be notified whenever the attempt limit is reached.
+            warn_on_max_attempts (bool, optional): Decides if user should be notified whenever every pool name is used and numbers are added to ensure a unique name.
         """
 
         # Initialize fields and collections for mapping names
         self.mappings: Dict[str, str] = {}
         self.used_names: Set[str] = set()
-        self.max_attempts = _max_attempts
+        self._suffix_counts: Dict[str, int] = {} #Last number suffix given to each base name by the fallback in get_safe_name
         self.warn_on_max_attempts = _warn_on_max_attempts
         self.seed = _seed if _seed else random.randint(0,255)# Generate random seed if none specified
             
@@ -128,47 +158,84 @@ class Renamer:
             self.mappings: Dict[str, str] = _prior_mappings.copy() #Copy prior mappings if provided. Constructor argument defaults to empty dict
             self.used_names: Set[str] = set(_prior_mappings.values()) if _prior_mappings else set() #Set of already used safe names to ensure uniqueness
         
-        # Set up Faker with seed
-        self.fake = Faker()
-        Faker.seed(self.seed)
-
-    def get_safe_name(self, original:str):
+        # Name pool and seeded generator are set up on the first name that needs generating, so runs served entirely by prior mappings never load them
+        self._free_names: Optional[list[str]] = None #Pool names not yet used by any mapping, in no particular order
+        self._rng: Optional[random.Random] = None
+
+    def _draw_free_name(self):
+        """ Returns a random pool name not used by any mapping yet, or None once every pool name is taken."""
+        if self._free_names is None:
+            self._free_names = [name for name in _shared_first_names() if name not in self.used_names]
+            self._rng = random.Random(self.seed)
+
+        free_names = self._free_names
+        randrange = self._rng.randrange
+        while free_names:
+            # Move the last name into the drawn slot, removing the drawn name in O(1)
+            i = randrange(len(free_names))
+            name = free_names[i]
+            free_names[i] = free_names[-1]
+            free_names.pop()
+            # Skip names merged in since the pool was built
+            if name not in self.used_names:
+                return name
+        return None
+
+    def get_safe_name(self, original:str) -> str:
         """ Generates or retrieves a safe name for the given original name, storing new mappings."""
+
+        # Check the raw string first. Tokens are usually already stripped, so most hits skip the strip() allocation below
+        existing = self.mappings.get(original)
+        if existing is not None:
+            return existing
         
-        # Return empty or whitespace-only names.
-        if not original or not original.strip() or original is None:
+        # Return empty or whitespace-only names. (Truthiness covers None too)
+        if not original:
+            return original
+        stripped = original.strip()
+        if not stripped:
             return original
             
-        # Strip whitespace for consistent mapping, return existing mapping if present
-        original = original.strip()
-        if original in self.mappings:
-            return self.mappings[original]
-        
-        # Try to generate a unique name.
-        for attempt in range(self.max_attempts):
-
-            # Generate a name, storing the mapping if its unique. Otherwise 
-            candidate = self.fake.first_name()
-            if candidate not in self.used_names:
-                self.mappings[original] = candidate
-                self.used_names.add(candidate)
-                return candidate
-
-        # If attempts fail, add number suffix to ensure uniqueness
-        base_name = self.fake.first_name()
-        counter = len(self.used_names)
-        candidate = f"{base_name}{counter}"
+        # Use stripped name for consistent mapping, return existing mapping if present
+        original = stripped
+        existing = self.mappings.get(original)
+        if existing is not None:
+            return existing
+        
+        # Draw an unused name, storing the mapping. Drawing only from unused names means no retries are needed
+        candidate = self._draw_free_name()
+        if candidate is not None:
+            self.mappings[original] = candidate
+            self.used_names.add(candidate)
+            return candidate
+
+        # Once every pool name is used, add the next free number suffix for a random base name to ensure uniqueness.
+        # Counting per base name means a suffix is only retried if a loaded session already holds that exact name
+        base_name = self._rng.choice(_shared_first_names())
+        suffix = self._suffix_counts.get(base_name, 0) + 1
+        candidate = f"{base_name}{suffix}"
+        while candidate in self.used_names:
+            suffix += 1
+            candidate = f"{base_name}{suffix}"
+        self._suffix_counts[base_name] = suffix
         
         # Store new mapping
         self.mappings[original] = candidate
         self.used_names.add(candidate)
 
-        # Warn user if max attempts were reached
+        # Warn user if the name pool ran out
         if self.warn_on_max_attempts:
-            print(f"Max attempts reached ({attempt}). Assigned unique name '{candidate}' for original name '{original}'.")
+            print(f"All pool names used. Assigned unique name '{candidate}' for original name '{original}'.")
 
         return candidate
 
+    def merge_mappings(self, other_mappings:Dict[str,str]):
+        """ Adds mappings made by another Renamer, keeping any existing mapping for the same original."""
+        for original, safe_name in other_mappings.items():
+            if original not in self.mappings:
+                self.mappings[original] = safe_name
+                self.used_names.add(safe_name)
+
 class Configuration:
     """ Configuration class assembles inputs and settings for use by the CSVProcessor.
     
@@ -203,6 +270,10 @@ class Configuration:
         self.auto_detect_columns = False
         self.rename_whole_cells = False  #Applies renaming function to whole cells. For formats with multiple names in a cell ("First Last", "Last, First" "Hyphen-ated") this can lead to inconsistent outputs, and should be applied with caution
         self.warn_max_attempts = False
+        self.parallel_processing = False #Processes each file in its own worker process, after a pre-scan assigns every name
+        self.fast_csv = False #Splits simple unquoted files on raw bytes instead of using the csv module
+        self.minimal_quoting = False #Skips quoting every output field when the input file uses quotes, writing smaller files
+        self.forced_dialect = None #Name of a csv module dialect to write every file with, in place of detecting each file's dialect
         self.applied_default_columns = False #Toggled for accurate print confirmation of what happens during config
         
         self.mapping_path = None
@@ -219,18 +290,22 @@ class Configuration:
             "-p" : lambda x: setattr(self, 'selected_prefix', x),   #Set selected prefix for output files
             "-s" : lambda x: setattr(self, 'selected_seed', x),     #Set selected seed for deterministic generation (defaults to true random)
             "-m" : lambda x: setattr(self, 'mapping_path',x),        #Set path for loading/saving mapping sessions
+            "-d" : lambda x: setattr(self, 'forced_dialect', None if x == "sniff" else x), #Set output dialect for all files, skipping detection. 'sniff' keeps detection
         }
             
         # Map command-line options to lambda functions that handle their actions
         self.option_mappings = {
-            "--help" : lambda : (print(HELP_TEXT), self._autostop_warning("--help"), exit(0)), #Print help, warn if extra args were provided, exit
-            "--menu" : lambda : (print(MENU_TEXT), self._autostop_warning("--menu"), exit(0)), #Print menu, warn if extra args were provided, exit
+            "--help" : lambda : (print(HELP_TEXT), self._autostop_warning("--help"), sys.exit(0)), #Print help, warn if extra args were provided, exit
+            "--menu" : lambda : (print(MENU_TEXT), self._autostop_warning("--menu"), sys.exit(0)), #Print menu, warn if extra args were provided, exit
             "--skip" : lambda : setattr(self, 'skip_confirmation_step', True),                 #Set boolean to bypass manual confirmation step
             "--defaultcolumns" : lambda : (self.columns.update(self.default_columns),
                                            setattr(self,'applied_default_columns',True)),      #Update selected columns to include defaults, set boolean for accurate reporting.
             "--renamewholecells" : lambda : setattr(self, 'rename_whole_cells', True),         #Set boolean to rename whole cells, rather than tokenizing
-            "--warnmaxattempts" : lambda : setattr(self, 'warn_max_attempts', True),           #Set boolean to notify user when renaming attempts max out and numbers are added
-            "--autocolumns" : lambda : setattr(self, 'auto_detect_columns', True)              #Set boolean to auto-detect name columns
+            "--warnmaxattempts" : lambda : setattr(self, 'warn_max_attempts', True),           #Set boolean to notify user when the name pool runs out and numbers are added
+            "--autocolumns" : lambda : setattr(self, 'auto_detect_columns', True),             #Set boolean to auto-detect name columns
+            "--parallel" : lambda : setattr(self, 'parallel_processing', True),               #Set boolean to process files in parallel worker processes
+            "--fastcsv" : lambda : setattr(self, 'fast_csv', True),                           #Set boolean to use byte-level fast path for simple files
+            "--minimalquoting" : lambda : setattr(self, 'minimal_quoting', True)              #Set boolean to quote output fields only where needed
         }
         
     def _autostop_warning(self,flag:str):
@@ -244,20 +319,21 @@ class Configuration:
             Args: arg_queue (list): list of command-line arguments to process
         """
         self.argument_count = len(arg_queue)
+        arg_queue = deque(arg_queue) #popleft() is O(1), where list.pop(0) shifts every remaining argument
 
         # Pop arguments from queue, treating as flags, options, or inputs
         while len(arg_queue) > 0:
-            current_arg = arg_queue.pop(0)
+            current_arg = arg_queue.popleft()
 
             #Catch input flags, using the following argument as their input
             if current_arg in self.flag_mappings:
                 #If no argument follows the flag, reject
                 if len(arg_queue) == 0:
                     print(f"caught input flag ({current_arg}) without an argument following. Exiting for safety")
-                    exit(1)
+                    sys.exit(1)
 
                 #If an argument follows the flag, pop it and use as input for the flag function
-                next_arg = arg_queue.pop(0)
+                next_arg = arg_queue.popleft()
                 self.flag_mappings[current_arg](next_arg)
 
             #Catch option flags, calling their relevant function
@@ -270,7 +346,7 @@ class Configuration:
                 #self.flag_mappings["-f"](current_arg)
 
                 print(f"currently no support for argument: '{current_arg}' without a preceding flag. Exiting for safety. run with flag --help or --menu for more information")
-                exit(1)
+                sys.exit(1)
 
     def setup_config(self):
         """ Handles a series of setup steps using helper methods. This sequence follows argument processing, and precedes validation and reporting."""
@@ -284,16 +360,16 @@ class Configuration:
         """ Helper method to validate and filter files from self.files."""
         approved_files = []        
         for filepath in self.files:
-            try:
-                with open(filepath, 'r', encoding='utf-8-sig') as f:
-                    pass  # Check if file can be opened
-                approved_files.append(filepath)
-            except FileNotFoundError:
+            # Check readability with stat/access calls rather than opening and closing each file
+            if os.path.isfile(filepath):
+                if os.access(filepath, os.R_OK):
+                    approved_files.append(filepath)
+                else:
+                    print(f"Warning: Permission denied, skipping: {filepath}")
+            elif os.path.exists(filepath):
+                print(f"Warning: Cannot read file, skipping: {filepath} (not a regular file)")
+            else:
                 print(f"Warning: File not found, skipping: {filepath}")
-            except PermissionError:
-                print(f"Warning: Permission denied, skipping: {filepath}")
-            except Exception as e:
-                print(f"Warning: Cannot read file, skipping: {filepath} ({e})")  
         self.files = set(approved_files)
     
     def _apply_mappings_if_specified(self):
@@ -346,10 +422,10 @@ class Configuration:
         #If loading fails, print raised errors (formatted elsewhere) and exit 
         except (FileNotFoundError,ValueError) as e:
             print(f"{e}")
-            exit(1)
+            sys.exit(1)
         except Exception as e:
             print(f"{e}")
-            exit(1)   
+            sys.exit(1)   
 
     def _resolve_columns(self):
         """ Finish setup steps relating to column names, veryifying inputs and applying defaults where relevant"""
@@ -418,6 +494,10 @@ class Configuration:
         if not self.columns:
             print("No columns specified or detected. Use -c <column> to add columns.")
             return False
+        # Ensure a forced dialect is one the csv module knows
+        if self.forced_dialect is not None and self.forced_dialect not in csv.list_dialects():
+            print(f"Unknown dialect '{self.forced_dialect}'. Use -d with one of: {', '.join(sorted(csv.list_dialects()))}, or sniff.")
+            return False
         # Return true if inputs are valid
         return True
 
@@ -432,6 +512,8 @@ class Configuration:
             print(f"Seed: {self.selected_seed}")
         if self.mapping_path:
             print(f"Mapping file: {self.mapping_path}")
+        if self.forced_dialect is not None:
+            print(f"Dialect: {self.forced_dialect}")
         print()
 
     def user_confirm(self):
@@ -467,34 +549,125 @@ class CSVProcessor:
         #Store key values and settings
         self.target_files = self.config.files
         self.given_prefix = self.config.selected_prefix
-        self.lowercase_columns = {col.lower(): col for col in config.columns} #store columns in lowercase for standardized comparison
-        self.rename_whole_cells = config.rename_whole_cells
+        self.lowercase_columns = frozenset(col.lower() for col in self.config.columns) #store columns in lowercase for standardized comparison. Only membership is needed, so a set rather than a map
+        self.rename_whole_cells = self.config.rename_whole_cells
+        self.fast_csv = self.config.fast_csv
+        self.minimal_quoting = self.config.minimal_quoting
+        self.forced_dialect = csv.get_dialect(self.config.forced_dialect) if self.config.forced_dialect else None #Looked up once, used for every file
+
+        #Choose the renaming strategy once, since rename_whole_cells is fixed for the run. Avoids a branch per cell
+        #If rename_whole_cells is True, applies renamer to the whole string, rather than chunks split by designated characters
+        #   ^For formats with multiple names in a cell ("First Last", "Last, First" "Hyphen-ated") this can lead to inconsistent outputs, and should be applied with caution
+        self._rename_cell = self.renamer.get_safe_name if self.rename_whole_cells else self._rename_tokenized
+
+        #Cache of finished outputs keyed by raw cell value. Repeated cells (same person on many rows) skip tokenizing and renaming entirely
+        self._cell_cache: Dict[str, str] = {}
     
     def start_processing(self):
         """ Iterates through input files and applies processes each individually, logging each result to console."""
         
+        #Hand off to worker processes if enabled, there's more than one file to split up, and more than one CPU to run workers on.
+        #With a single worker the pre-scan would only add to serial processing time
+        if self.config.parallel_processing and len(self.target_files) > 1 and (os.cpu_count() or 1) > 1:
+            self._start_parallel_processing()
+            return
+
         for input_file in sorted(self.target_files):
             output_file = f"{self.given_prefix}-{input_file}"
-            print(f"Processing {input_file} -> {output_file}",end=" | ") #Line ends with a pipe, and try/catch ensures the result is printed on the same line
+            print(f"Processing {input_file} -> {output_file}",end=" | ") #Line ends with a pipe, and the result is printed on the same line
+            print(self._try_process_file(input_file, output_file))
 
-            # Try to process the file, printing the result after the pipe
+    def _start_parallel_processing(self):
+        """ Processes each input file in its own worker process, logging results in file order and merging worker mappings back into this renamer."""
+        
+        #Assign every name up front, in the same order serial processing would. Workers then only look names up, keeping mappings consistent across files
+        input_files = sorted(self.target_files)
+        self._prime_mappings(input_files)
+
+        #Workers get plain settings rather than the Configuration, since its flag mappings hold lambdas that can't be pickled
+        settings = {
+            "seed" : self.renamer.seed,
+            "warn_max_attempts" : self.renamer.warn_on_max_attempts,
+            "mappings" : self.renamer.mappings,
+            "columns" : self.config.columns,
+            "rename_whole_cells" : self.rename_whole_cells,
+            "fast_csv" : self.fast_csv,
+            "minimal_quoting" : self.minimal_quoting,
+            "forced_dialect" : self.config.forced_dialect,
+        }
+        tasks = [(input_file, f"{self.given_prefix}-{input_file}") for input_file in input_files]
+        
+        #Settings (including the primed mappings) are sent once per worker through the initializer, rather than pickled into every task
+        max_workers = min(len(tasks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(settings,)) as executor:
+            #map() yields in submission order, so output reads the same as serial processing
+            for (input_file, output_file), (result, worker_mappings) in zip(tasks, executor.map(_process_file_in_worker, tasks)):
+                print(f"Processing {input_file} -> {output_file} | {result}")
+                self.renamer.merge_mappings(worker_mappings) #Normally a no-op after priming, but keeps anything a worker had to generate
+
+    def _prime_mappings(self, input_files:list[str]):
+        """ Pre-scan input files in order, passing every first-seen name in target columns to the renamer without building or writing output rows.
+            Files that can't be read are skipped here, and reported when processed.
+        """
+        
+        #Cells already handled in any file. Later repeats can't assign anything new, so they're skipped with one set lookup
+        seen_cells: Set[str] = set()
+        for input_file in input_files:
             try:
+                with open(input_file, 'r', newline='', encoding='utf-8-sig', buffering=IO_BUFFER_SIZE) as infile:
+                    #Read the same way _process_file does, so cells match those serial processing renames
+                    reader = csv.reader(infile)
+                    header = next(reader, None)
+                    if not header:
+                        continue
+                    valid_indices = [i for i, f in enumerate(header) if f and f.strip()]
+                    target_indices = self._detect_target_indices(header,valid_indices)
+                    if target_indices:
+                        self._assign_first_seen_names(reader,target_indices,seen_cells)
+            except Exception:
+                continue
+
+    def _assign_first_seen_names(self, reader:Iterator[list[str]], target_indices:list[int], seen_cells:Set[str]):
+        """ Calls the renamer for each new name in the target columns, in the same order _renamed_rows would, following the rules of _apply_renaming."""
+
+        get_safe_name = self.renamer.get_safe_name
+        split = _SPLIT_RE.split
+        rename_whole_cells = self.rename_whole_cells
+        for row in reader:
+            #Short rows and blank lines would be padded with empty cells, which are never renamed
+            row_length = len(row)
+            for i in target_indices:
+                if i >= row_length:
+                    continue
+                cell = row[i]
+                if not cell or cell in seen_cells:
+                    continue
+
+                #Whole cells are one name, otherwise only the name parts between separators are.
+                #Parts share the seen set with cells, since a part is renamed exactly as a lone cell holding it would be
+                for part in ((cell,) if rename_whole_cells else split(cell)[::2]):
+                    if part and part not in seen_cells:
+                        seen_cells.add(part)
+                        if any(c.isalpha() for c in part):
+                            get_safe_name(part)
+                seen_cells.add(cell)
+
+    def _try_process_file(self, input_file:str, output_file:str) -> str:
+        """ Try to process a single file, returning a result message to report instead of raising."""
+        
+        try:
+            #The fast path always writes plain comma separated output, so a forced dialect takes the csv module path
+            if self.fast_csv and self.forced_dialect is None:
+                self._process_file_fast(input_file, output_file)
+            else:
                 self._process_file(input_file, output_file)
-                print("Success")
-            #Catch file errors to return a warning string, otherwise return None for success
-            except FileNotFoundError:
-                print("Error: file not found. Skipping")
-            except Exception as e:
-                print(f"Error: {e}")
+            return "Success"
+        #Catch file errors to return a warning string
+        except FileNotFoundError:
+            return "Error: file not found. Skipping"
+        except Exception as e:
+            return f"Error: {e}"
             
-    def _rename_row_cells(self,row:dict,target_columns:list[str]):
-        """Generate a renamed row by applying the renaming process to each target column in the given row."""
-        
-        for col in target_columns:
-            #If row has a non-empty value for the target column, replace with output of renaming function
-            if row[col]:
-                row[col] = self._apply_renaming(row[col])
-
     def _process_file(self, input_path: str, output_path: str):
         """ Iterate through an input file, replacing names in target columns and writing changes to output file.
 
@@ -502,131 +675,335 @@ class CSVProcessor:
             FileNotFoundError: If the input file does not exist.
             PermissionError: If the file cannot be accessed.
             ValueError: If no headers are found in the input file, or if later a column is missing.
-        These exceptions will be caught in start_processing() and reported to the user.
+        These exceptions will be caught in _try_process_file() and reported to the user.
         """
         
-        # No try catch for file operation, as the calling method start_processing() catches all exceptions and reports status to terminal.
-        with open(input_path, 'r', newline='', encoding='utf-8-sig') as infile:
+        # No try catch for file operation, as _try_process_file() catches all exceptions and returns them as the status printed to terminal.
+        with open(input_path, 'r', newline='', encoding='utf-8-sig', buffering=IO_BUFFER_SIZE) as infile:
                 
             # Detect dialect for file writing
             detected_dialect = self._detect_dialect(infile)
 
-            # Create CSV reader for input file
-            reader = csv.DictReader(infile)
+            # Create list-based CSV reader for input file. Rows stay as lists, avoiding a dict build and teardown per row
+            reader = csv.reader(infile)
+            header = next(reader, None)
 
             #Skip files with no headers, something went wrong
-            if not reader.fieldnames:
+            if not header:
                 raise ValueError("No headers found.")
             
             # Filter empty headers caused by trailing commas or empty headers.
             # This alters output header from original, but averts errors in future file use.
-            valid_fieldnames = [f for f in reader.fieldnames if f and f.strip()]
+            valid_indices = [i for i, f in enumerate(header) if f and f.strip()]
+
+            #Compare present headers to config columns, building list of target column positions to rename
+            target_indices = self._detect_target_indices(header,valid_indices)
+
+            # If no columns matched, send a warning back instead of silently writing unmodified file.
+            # Checked before the output is opened, so no rows are parsed and no empty output file is left behind
+            if not target_indices:
+                raise ValueError("No name columns to modify.") 
             
             # Write renamed file
-            self._write_renamed_file(output_path,reader,detected_dialect,valid_fieldnames)
+            self._write_renamed_file(output_path,reader,detected_dialect,header,valid_indices,target_indices)
+
+    def _process_file_fast(self, input_path: str, output_path: str):
+        """ Byte-level alternative to _process_file for simple comma separated files, splitting lines and cells with bytes.split.
+            Files containing any quote character are handed to _process_file, since quoted fields can hold commas and newlines.
+            So are files with bare \r line endings (old Mac exports), since lines are only split on \n.
+            Line endings are kept as they appear in the input.
+
+        Raises the same exceptions as _process_file, caught in _try_process_file() and reported to the user.
+        """
+        
+        # Read the whole file in one call. Splitting needs a bytes object, so memory mapping wouldn't avoid this copy
+        with open(input_path, 'rb', buffering=IO_BUFFER_SIZE) as infile:
+            data = infile.read()
+        
+        # Fall back to the csv module for anything quoted, or any \r not followed by \n.
+        # Splitting on \n alone would read a CR-only file as one header line and write its names back unchanged
+        if b'"' in data or data.count(b'\r') != data.count(b'\r\n'):
+            self._process_file(input_path, output_path)
+            return
+        
+        # Drop the byte order mark, matching utf-8-sig decoding in the normal path
+        if data.startswith(b'\xef\xbb\xbf'):
+            data = data[3:]
+        
+        lines = data.split(b'\n')
+        header = lines[0].rstrip(b'\r').decode('utf-8').split(',')
+        
+        #Skip files with no headers, something went wrong
+        if not header or header == ['']:
+            raise ValueError("No headers found.")
+        
+        # Empty headers are filtered by the normal path, so leave that case to it
+        valid_indices = [i for i, f in enumerate(header) if f and f.strip()]
+        if len(valid_indices) != len(header):
+            self._process_file(input_path, output_path)
+            return
+        
+        #Compare present headers to config columns, building list of target column positions to rename
+        target_indices = self._detect_target_indices(header,valid_indices)
+        if not target_indices:
+            raise ValueError("No name columns to modify.")
+        
+        # Renamed cells are cached as bytes, so repeats skip decoding and encoding as well as renaming
+        byte_cache: Dict[bytes, bytes] = {}
+        apply_renaming = self._apply_renaming
+        width = len(header)
+        
+        # No try catch for file operation, as _try_process_file() catches all exceptions and returns them as the status printed to terminal.
+        with open(output_path, 'wb', buffering=IO_BUFFER_SIZE) as outfile:
+            write = outfile.write
+            write(lines[0] + b'\n' if len(lines) > 1 else lines[0])
+            
+            for line in lines[1:]:
+                # Separate the line ending so it can be written back unchanged
+                ending = b'\r\n' if line.endswith(b'\r') else b'\n'
+                line = line.rstrip(b'\r')
+                
+                #Skip blank lines, as the csv module does
+                if not line:
+                    continue
+                cells = line.split(b',')
+                if len(cells) != width:
+                    cells = (cells + [b''] * width)[:width]
+                
+                for i in target_indices:
+                    cell = cells[i]
+                    if cell:
+                        renamed = byte_cache.get(cell)
+                        if renamed is None:
+                            renamed = apply_renaming(cell.decode('utf-8')).encode('utf-8')
+                            byte_cache[cell] = renamed
+                        cells[i] = renamed
+                write(b','.join(cells) + ending)
 
     def _detect_dialect(self,infile: TextIO):
         """ Check input file dialect for faithful file reproduction."""
         
+        #A dialect given with -d applies to every file, so no sample is read
+        if self.forced_dialect is not None:
+            return self.forced_dialect
+
         #sample initial characters for dialect detection, then reset file pointer
-        sample = infile.read(1024)
+        sample = infile.read(DIALECT_SAMPLE_SIZE)
         infile.seek(0)  
-        #Attempt to detect dialect, defaulting to excel if detection fails
+        #Attempt to detect dialect, defaulting to excel if detection fails. Unquoted samples with a uniform delimiter skip the slower Sniffer
         try:
-            dialect = csv.Sniffer().sniff(sample)
-            if '"' in sample:
+            dialect = self._guess_simple_dialect(sample) or csv.Sniffer().sniff(sample)
+            #Files using quotes are assumed to quote every field, unless minimal quoting was requested
+            if '"' in sample and not self.minimal_quoting:
                 dialect.quoting = csv.QUOTE_ALL 
             return dialect
         except csv.Error:
             return csv.excel
 
+    def _guess_simple_dialect(self,sample:str):
+        """ Returns the dialect csv.Sniffer would give an unquoted sample with a uniform delimiter, or None if the sample needs sniffing."""
+
+        #Quote characters change how Sniffer reads the sample, so those are left to it
+        if '"' in sample or "'" in sample:
+            return None
+        lines = sample.split('\n')
+        truncated = len(sample) == DIALECT_SAMPLE_SIZE and not sample.endswith('\n')
+        #A full sample usually stops partway through a row, and that partial last line would break the uniform count below
+        if truncated:
+            lines.pop()
+        lines = [line for line in lines if line]
+        if not lines:
+            return None
+
+        #Sniffer first judges the delimiter on 10 lines. With fewer complete lines the partial one is counted too, and Sniffer
+        #may raise, where _detect_dialect falls back to csv.excel. Those samples are left to it, keeping the same outcome
+        if truncated and len(lines) < 10:
+            return None
+
+        #Sniffer prefers these in this order when more than one appears the same number of times on every line
+        for delimiter in (',', '\t', ';'):
+            count = lines[0].count(delimiter)
+            if count and all(line.count(delimiter) == count for line in lines):
+                break
+        else:
+            return None
+
+        class dialect(csv.Dialect):
+            _name = "sniffed"
+            lineterminator = '\r\n'
+            quoting = csv.QUOTE_MINIMAL
+            quotechar = '"'
+            doublequote = False
+        dialect.delimiter = delimiter
+        dialect.skipinitialspace = lines[0].count(delimiter) == lines[0].count(delimiter + ' ')
+        return dialect
+
     def _write_renamed_file(self,output_path:str, 
-                            reader:csv.DictReader, 
+                            reader:Iterator[list[str]], 
                             detected_dialect:csv.Dialect, 
-                            valid_fieldnames:list[str]) -> str:
+                            header:list[str],
+                            valid_indices:list[int],
+                            target_indices:list[int]) -> str:
         """ Write renamed CSV file to output path, applying renaming to target columns."""
         
-        # No try catch for file operation, as the calling method start_processing() catches all exceptions and reports status to terminal.
-        with open(output_path, 'w', newline='', encoding='utf-8') as outfile:
+        # No try catch for file operation, as _try_process_file() catches all exceptions and returns them as the status printed to terminal.
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as outfile:
 
-            #Compare present headers to config columns, building list of target columns to rename
-            target_columns = self._detect_target_columns(valid_fieldnames)
+            #Set up writer with the input dialect, then write the filtered header
+            writer = csv.writer(outfile, dialect=detected_dialect)
+            writer.writerow([header[i] for i in valid_indices])
 
-            # If no columns matched, send a warning back instead of silently writing unmodified file
-            if not target_columns:
-                raise ValueError("No name columns to modify.") 
+            renamed_rows = self._renamed_rows(reader,header,valid_indices,target_indices)
 
-            #Set up writer with same fieldnames as reader, then write header
-            writer = csv.DictWriter(
-                outfile,
-                fieldnames=valid_fieldnames,
-                dialect=detected_dialect,
-                extrasaction='ignore'
-            )
-            writer.writeheader()
-            
-            #iterate through rows, applying renaming function
-            for row in reader:
-                self._rename_row_cells(row,target_columns)
+            #All-quoted output is simple enough to format directly, which is much faster than the csv writer. Other dialects go through writerows()
+            if self._can_format_quote_all(detected_dialect):
+                self._write_quote_all_rows(outfile,writer,detected_dialect,renamed_rows)
+            else:
+                writer.writerows(renamed_rows)
+
+    def _renamed_rows(self,
+                      reader:Iterator[list[str]],
+                      header:list[str],
+                      valid_indices:list[int],
+                      target_indices:list[int]) -> Iterator[list[str]]:
+        """ Yield rows from the reader with target cells renamed, ready to write under the filtered header."""
 
-                # Write row with replaced names
-                writer.writerow(row)
+        #Rows are written whole when every header is valid, otherwise only the valid columns are kept
+        width = len(header)
+        keep_all_columns = len(valid_indices) == width
 
-    def _detect_target_columns(self,fieldnames:list[str]):
-        """ Compare present headers to config columns, building list of target columns to rename."""
+        #Bind renaming method to a local once per file, skipping repeated attribute lookups in the loop
+        apply_renaming = self._apply_renaming
         
-        target_columns = []
-        for header in fieldnames:
-            if header.lower() in self.lowercase_columns: #checking in standardized lower case
-                target_columns.append(header)
-        return target_columns
-        #return [h for h in fieldnames if h.lower() in self.lowercase_columns] #more concise, less readable
+        #iterate through rows, applying renaming function
+        for row in reader:
+            #Skip blank lines and pad short rows / drop extra fields, matching the previous DictReader/DictWriter behavior
+            if not row:
+                continue
+            if len(row) != width:
+                row = (row + [""] * width)[:width]
+
+            #If row has a non-empty value for a target column, replace with output of renaming function. Each cell is read once
+            for i in target_indices:
+                cell = row[i]
+                if cell:
+                    row[i] = apply_renaming(cell)
+
+            # Yield row with replaced names
+            yield row if keep_all_columns else [row[i] for i in valid_indices]
+
+    def _can_format_quote_all(self,dialect:csv.Dialect) -> bool:
+        """ Check if a dialect quotes every field without escape characters, the case _write_quote_all_rows can format by hand."""
+        return dialect.quoting == csv.QUOTE_ALL and bool(dialect.quotechar) and not dialect.escapechar
+
+    def _write_quote_all_rows(self,outfile:TextIO,writer,dialect:csv.Dialect,rows:Iterator[list[str]]):
+        """ Write rows with every field quoted by joining strings directly, matching csv.writer output for QUOTE_ALL dialects."""
+
+        quote = dialect.quotechar
+        separator = quote + dialect.delimiter + quote
+        ending = quote + dialect.lineterminator
+        write = outfile.write
+        write_row = writer.writerow
+
+        for row in rows:
+            #Cells containing the quote character need escaping, so those rows are left to the csv writer
+            if quote in "".join(row):
+                write_row(row)
+            else:
+                write(quote + separator.join(row) + ending)
 
-    def _apply_renaming(self,name_string: str):
+    def _detect_target_indices(self,header:list[str],valid_indices:list[int]) -> list[int]:
+        """ Compare present headers to config columns, building list of target column positions to rename."""
+        
+        target_indices = []
+        for i in valid_indices:
+            if header[i].lower() in self.lowercase_columns: #checking in standardized lower case
+                target_indices.append(i)
+        return target_indices
+        #return [i for i in valid_indices if header[i].lower() in self.lowercase_columns] #more concise, less readable
+
+    def _apply_renaming(self,name_string: str) -> str:
         """ Given a name string, returns a renamed, ready to use version."""
 
-        #If rename_whole_cells is True, applies renamer to the whole string, rather than chunks split by designated characters
-        #   ^For formats with multiple names in a cell ("First Last", "Last, First" "Hyphen-ated") this can lead to inconsistent outputs, and should be applied with caution
-        if self.rename_whole_cells: 
-            return self.renamer.get_safe_name(name_string)
+        #Return cached output if this exact cell value was already renamed
+        cached = self._cell_cache.get(name_string)
+        if cached is not None:
+            return cached
 
+        #Cells without any letters (whitespace, numeric IDs, punctuation) aren't names, so they map to themselves. The cache below makes repeats free
+        if not any(c.isalpha() for c in name_string):
+            result = name_string
+        #Otherwise apply the renaming strategy chosen in __init__
         else:
-            #splitting_strings = ["jr","sr",del] #FUTURE - also exempt strings like titles and connecting words? # Not needed for my use case and may expose unique name formats
-            splitting_characters = [' ','-','–','—',',']
+            result = self._rename_cell(name_string)
 
-            built_string = ""
-            pending_chars = ""
+        #Store output for later repeats of the same cell value
+        self._cell_cache[name_string] = result
+        return result
 
-            #Iterate through characters in string, pausing to rename and append recent characters whenever a splitting character is reached.
-            for c in name_string:
-                if c in splitting_characters:
-                    renamed_string = self.renamer.get_safe_name(pending_chars)
+    def _rename_tokenized(self,name_string: str) -> str:
+        """ Renames each name part of a cell individually, keeping separators as they were."""
 
-                    #append renamed string and splitting token, then clear pendingChars
-                    built_string += renamed_string
-                    built_string += c
-                    pending_chars = ""
-                else:
-                    pending_chars+=c
-            
-            #if a remainder exists, rename and append
-            if pending_chars != "":
-                built_string += self.renamer.get_safe_name(pending_chars)
+        #Split into alternating name parts (even indices) and separators (odd indices), renaming only the name parts
+        #Parts without letters, like the "42" in "Ann 42", stay as they are, matching the whole-cell rule in _apply_renaming()
+        parts = _SPLIT_RE.split(name_string)
+        get_safe_name = self.renamer.get_safe_name
+        for i in range(0, len(parts), 2):
+            part = parts[i]
+            if part and any(c.isalpha() for c in part):
+                parts[i] = get_safe_name(part)
 
-            return built_string
+        return "".join(parts)
 
-if __name__ == "__main__":
-    """ Main execution block for the NameSwap application. Sets up configuration, processes files, and logs results to terminal."""
+#Per-process state for parallel workers, set up once by _init_worker
+_worker_processor = None
+_worker_prior_mappings = None
+
+def _init_worker(settings:dict):
+    """ Worker process initializer for parallel processing. Rebuilds a renamer and processor from plain settings, 
+        kept for every file this worker handles.
+    """
+    global _worker_processor, _worker_prior_mappings
+
+    #Build a minimal configuration for this worker
+    worker_config = Configuration()
+    worker_config.columns = set(settings["columns"])
+    worker_config.rename_whole_cells = settings["rename_whole_cells"]
+    worker_config.fast_csv = settings["fast_csv"]
+    worker_config.minimal_quoting = settings["minimal_quoting"]
+    worker_config.forced_dialect = settings["forced_dialect"]
+
+    #Same seed and prior mappings as the parent, so each worker renames deterministically
+    worker_renamer = Renamer(settings["seed"],
+                             _warn_on_max_attempts=settings["warn_max_attempts"],
+                             _prior_mappings=settings["mappings"])
+    _worker_processor = CSVProcessor(worker_config, worker_renamer)
+    _worker_prior_mappings = settings["mappings"]
+
+def _process_file_in_worker(task:tuple):
+    """ Worker process entry point for parallel processing. Processes one file, returning the result message 
+        along with any mappings the worker added, so the parent can merge them.
+    """
+    input_file, output_file = task
+    result = _worker_processor._try_process_file(input_file, output_file)
+
+    #Only send back mappings the parent doesn't already have
+    new_mappings = {original: safe_name for original, safe_name in _worker_processor.renamer.mappings.items() 
+                    if original not in _worker_prior_mappings}
+    return result, new_mappings
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """ Main execution for the NameSwap application. Sets up configuration, processes files, and logs results to terminal. Returns the exit code."""
 
     #Set up config instance, process given arguments, finish setup
     config = Configuration()
-    config.process_args(sys.argv[1:])
+    config.process_args(sys.argv[1:] if argv is None else argv)
     config.setup_config()
 
     # Early return if validation fails. otherwise report ready
     if not config.validate_config():
         print("Exiting. Use --help or --menu for more usage information")
-        exit(1)
+        return 1
     
     # Print final configuration to console
     config.report_ready()
@@ -634,7 +1011,7 @@ if __name__ == "__main__":
     #Early return if user does not confirm
     if not config.skip_confirmation_step and not config.user_confirm():
         print("Exiting")
-        exit(0)
+        return 0
 
     #Notify user if confirmation step was skipped, before beginning processing
     if config.skip_confirmation_step:
@@ -648,9 +1025,9 @@ if __name__ == "__main__":
     file_processor = CSVProcessor(config,renamer)
 
     #Start process, timing for user feedback
-    start_time = time.perf_counter()
+    start_time = time.perf_counter_ns()
     file_processor.start_processing()
-    end_time = time.perf_counter()
+    end_time = time.perf_counter_ns()
     
     #Save session if mapping path specified
     if config.mapping_path:
@@ -658,5 +1035,9 @@ if __name__ == "__main__":
             print(f"Mapping session saved to {config.mapping_path}")
             
     #Determine elapsed time and print exit message
-    elapsed_time = end_time - start_time
+    elapsed_time = (end_time - start_time) / 1e9 #Integer nanoseconds to seconds
     print(f"Process finished in {elapsed_time:0.3f}s\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
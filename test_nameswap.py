@@ -0,0 +1,288 @@
+""" Regression checks for nameswap.py. Run with: python -m unittest"""
+
+import contextlib
+import csv
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import nameswap
+from nameswap import Configuration, Renamer, CSVProcessor, SessionManager, DIALECT_SAMPLE_SIZE
+
+
+def _make_processor(columns, **settings):
+    """ Builds a CSVProcessor the way main() does, with the given columns and Configuration attributes."""
+    config = Configuration()
+    config.columns = set(columns)
+    config.selected_prefix = "renamed"
+    for key, value in settings.items():
+        setattr(config, key, value)
+    return CSVProcessor(config, Renamer("7"))
+
+
+class _TempFileTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+
+    def _run(self, data:bytes, **settings) -> tuple[str, bytes]:
+        """ Writes data to an input file, processes it, and returns the result message and output bytes."""
+        input_path = os.path.join(self.tempdir.name, "in.csv")
+        output_path = os.path.join(self.tempdir.name, "out.csv")
+        with open(input_path, 'wb') as f:
+            f.write(data)
+        result = _make_processor(["First Name"], **settings)._try_process_file(input_path, output_path)
+        with open(output_path, 'rb') as f:
+            return result, f.read()
+
+
+class FastCSVTests(_TempFileTestCase):
+
+    def test_cr_only_line_endings_are_renamed(self):
+        """ Old Mac exports end lines with a bare \\r. The fast path must hand them to the csv path rather than copy names through."""
+        data = b"First Name,ID\rAnn,1\rBob,2\r"
+        for fast_csv in (False, True):
+            with self.subTest(fast_csv=fast_csv):
+                result, output = self._run(data, fast_csv=fast_csv)
+                self.assertEqual(result, "Success")
+                self.assertNotIn(b"Ann", output)
+                self.assertNotIn(b"Bob", output)
+                self.assertIn(b"ID", output)
+
+    def test_repeated_headers_keep_their_own_values(self):
+        """ Columns sharing a header are renamed independently, rather than all taking the last column's value."""
+        data = b"First Name,ID,First Name\r\nAnn,1,Bob\r\nCy,2,Cy\r\n"
+        for fast_csv in (False, True):
+            with self.subTest(fast_csv=fast_csv):
+                result, output = self._run(data, fast_csv=fast_csv)
+                self.assertEqual(result, "Success")
+                rows = list(csv.reader(io.StringIO(output.decode('utf-8'))))
+                self.assertEqual(rows[0], ["First Name", "ID", "First Name"])
+                self.assertNotEqual(rows[1][0], rows[1][2])
+                self.assertEqual(rows[2][0], rows[2][2])
+                self.assertNotIn("Ann", output.decode('utf-8'))
+
+    def test_fast_path_matches_csv_path(self):
+        """ For simple unquoted files, both paths write the same bytes for the same seed."""
+        data = b"First Name,ID\r\nAnn Lee,1\r\nBob,2\r\nAnn Lee,3\r\n"
+        self.assertEqual(self._run(data, fast_csv=True), self._run(data, fast_csv=False))
+
+
+class ForcedDialectTests(unittest.TestCase):
+
+    def _validated(self, *args) -> tuple[Configuration, bool]:
+        """ Processes the given arguments with a file and column set, returning the Configuration and validate_config's result."""
+        config = Configuration()
+        config.process_args(list(args))
+        config.files = {"in.csv"}
+        config.columns = {"First Name"}
+        with contextlib.redirect_stdout(io.StringIO()):
+            return config, config.validate_config()
+
+    def test_unknown_dialect_is_rejected(self):
+        """ -d only accepts names registered with the csv module, or sniff."""
+        self.assertFalse(self._validated("-d", "nope")[1])
+        config, valid = self._validated("-d", "excel-tab")
+        self.assertTrue(valid)
+        self.assertEqual(config.forced_dialect, "excel-tab")
+        config, valid = self._validated("-d", "sniff")
+        self.assertTrue(valid)
+        self.assertIsNone(config.forced_dialect)
+
+    def test_forced_dialect_skips_sniffing_and_is_written(self):
+        """ A forced dialect is used for output without reading a sample, on both the csv and fast paths."""
+        with tempfile.TemporaryDirectory() as tempdir:
+            input_path = os.path.join(tempdir, "in.csv")
+            output_path = os.path.join(tempdir, "out.csv")
+            with open(input_path, 'w', newline='') as f:
+                f.write("First Name,ID\r\nAnn,1\r\n")
+            for fast_csv in (False, True):
+                with self.subTest(fast_csv=fast_csv), \
+                     mock.patch.object(csv.Sniffer, "sniff", side_effect=AssertionError("sniffed")), \
+                     mock.patch.object(CSVProcessor, "_guess_simple_dialect", side_effect=AssertionError("guessed")):
+                    processor = _make_processor(["First Name"], forced_dialect="excel-tab", fast_csv=fast_csv)
+                    self.assertEqual(processor._try_process_file(input_path, output_path), "Success")
+                    with open(output_path, newline='') as f:
+                        rows = list(csv.reader(f, dialect="excel-tab"))
+                    self.assertEqual(rows[0], ["First Name", "ID"])
+                    self.assertEqual(rows[1][1], "1")
+                    self.assertNotEqual(rows[1][0], "Ann")
+
+
+class MinimalQuotingTests(_TempFileTestCase):
+
+    def test_minimal_quoting_keeps_quotes_only_where_needed(self):
+        """ Quoted input is written with every field quoted, unless --minimalquoting asks for quotes only where a field needs them."""
+        data = b'"First Name","ID","Notes"\r\n"Ann","1","a, b"\r\n'
+        result, output = self._run(data)
+        self.assertEqual(result, "Success")
+        self.assertTrue(output.startswith(b'"First Name","ID","Notes"\r\n'))
+        self.assertTrue(output.endswith(b'","1","a, b"\r\n'))
+
+        result, output = self._run(data, minimal_quoting=True)
+        self.assertEqual(result, "Success")
+        self.assertTrue(output.startswith(b'First Name,ID,Notes\r\n'))
+        self.assertTrue(output.endswith(b',1,"a, b"\r\n'))
+        self.assertNotIn(b'"1"', output)
+
+
+class RenamingTests(unittest.TestCase):
+
+    def test_parts_without_letters_are_kept(self):
+        """ Numeric parts of a tokenized cell map to themselves and never reach the Renamer."""
+        processor = _make_processor(["First Name"])
+        renamed = processor._apply_renaming("Ann 42")
+        self.assertTrue(renamed.endswith(" 42"))
+        self.assertNotIn("42", processor.renamer.mappings)
+
+
+class DialectGuessTests(unittest.TestCase):
+
+    DIALECT_ATTRIBUTES = ("delimiter", "doublequote", "escapechar", "lineterminator", "quotechar", "quoting", "skipinitialspace")
+
+    def _assert_matches_sniffer(self, text:str):
+        """ Asserts _detect_dialect gives the dialect csv.Sniffer would for the sample, or csv.excel where Sniffer raises."""
+        sample = text[:DIALECT_SAMPLE_SIZE]
+        try:
+            expected = csv.Sniffer().sniff(sample)
+        except csv.Error:
+            expected = csv.excel
+        detected = _make_processor(["First Name"])._detect_dialect(io.StringIO(text))
+        for attribute in self.DIALECT_ATTRIBUTES:
+            self.assertEqual(getattr(detected, attribute), getattr(expected, attribute), attribute)
+
+    def test_truncated_sample_is_guessed(self):
+        """ A full sample that stops partway through a row is still guessed, with the dialect Sniffer would give."""
+        text = "First Name;Last Name;ID\n" + "Ann;Lee;123\n" * 200
+        self.assertNotEqual(text[DIALECT_SAMPLE_SIZE - 1], "\n")
+        self.assertIsNotNone(_make_processor(["First Name"])._guess_simple_dialect(text[:DIALECT_SAMPLE_SIZE]))
+        self._assert_matches_sniffer(text)
+
+    def test_truncated_sample_of_long_rows_falls_back(self):
+        """ A few long rows cut off mid-row make Sniffer raise, so the excel fallback must be kept rather than guessed."""
+        text = "Notes,First Name\n" + ("x" * 300 + ",Ann\n") * 5 + 'he said "hi",Bob\n'
+        with self.assertRaises(csv.Error):
+            csv.Sniffer().sniff(text[:DIALECT_SAMPLE_SIZE])
+        self.assertIsNone(_make_processor(["First Name"])._guess_simple_dialect(text[:DIALECT_SAMPLE_SIZE]))
+        self._assert_matches_sniffer(text)
+
+        #csv.excel doubles the quotes in the later unquoted field, where a guessed dialect would fail to write it
+        with tempfile.TemporaryDirectory() as tempdir:
+            input_path = os.path.join(tempdir, "in.csv")
+            output_path = os.path.join(tempdir, "out.csv")
+            with open(input_path, 'w', newline='') as f:
+                f.write(text)
+            self.assertEqual(_make_processor(["First Name"])._try_process_file(input_path, output_path), "Success")
+            with open(output_path, newline='') as f:
+                self.assertIn('"he said ""hi"""', f.read())
+
+    def test_short_sample_is_guessed(self):
+        """ A whole file shorter than the sample is guessed with every attribute Sniffer would give."""
+        for text in ("First Name,ID\nAnn,1\nBob,2\n", "First Name\tID\r\nAnn\t1\r\n", "First Name, ID\nAnn, 1\n"):
+            with self.subTest(text=text):
+                self._assert_matches_sniffer(text)
+
+
+class QuoteAllWriterTests(unittest.TestCase):
+
+    ROWS = [
+        ["Ann", "1", "plain"],
+        ["Lee, Ann", "2", "tab\there; semicolon"],
+        ["Bob", "3", "line one\nline two\r\nline three"],
+        ['he said "hi"', "4", '"'],
+        ["", "", ""],
+        ["Zoë", "5", "'single'"],
+    ]
+
+    def test_matches_csv_writer(self):
+        """ Hand formatted QUOTE_ALL rows must be byte-identical to csv.writer output for the same dialect."""
+        class semicolon_dialect(csv.excel):
+            delimiter = ';'
+            lineterminator = '\n'
+        processor = _make_processor(["First Name"])
+        for base in (csv.excel, csv.excel_tab, semicolon_dialect):
+            class dialect(base):
+                quoting = csv.QUOTE_ALL
+            with self.subTest(dialect=base.__name__):
+                self.assertTrue(processor._can_format_quote_all(dialect))
+                expected = io.StringIO()
+                csv.writer(expected, dialect=dialect).writerows(self.ROWS)
+                written = io.StringIO()
+                processor._write_quote_all_rows(written, csv.writer(written, dialect=dialect), dialect, iter(self.ROWS))
+                self.assertEqual(written.getvalue().encode('utf-8'), expected.getvalue().encode('utf-8'))
+
+        #Escape characters are left to csv.writer entirely
+        class escaped_dialect(csv.excel_tab):
+            quoting = csv.QUOTE_ALL
+            doublequote = False
+            escapechar = '\\'
+        self.assertFalse(processor._can_format_quote_all(escaped_dialect))
+
+class ParallelProcessingTests(unittest.TestCase):
+
+    FILES = {
+        "a.csv": 'First Name,ID\nAnn Lee,1\nBob 42,2\nAnn Lee,3\n',
+        "b.csv": '"First Name","ID"\r\n"Lee, Cy","4"\r\n"Bob","5"\r\n',
+        "c.csv": 'Nickname,ID\nDee-Ann,6\n',
+        "d.csv": 'First Name,ID\nLee,7\n,8\nCy-Ann,9\nDee\n\n',
+    }
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.tempdir.name)
+        for name, data in self.FILES.items():
+            with open(name, 'w', newline='') as f:
+                f.write(data)
+
+    def _run(self, prefix:str, cpu_count:int) -> tuple[dict, str]:
+        """ Processes every file with --parallel set and the given CPU count, returning output files by input name and the saved session."""
+        processor = _make_processor(["First Name"], files=set(self.FILES), selected_prefix=prefix,
+                                    parallel_processing=True, mapping_path=f"{prefix}.json")
+        with mock.patch.object(nameswap.os, "cpu_count", return_value=cpu_count), contextlib.redirect_stdout(io.StringIO()):
+            processor.start_processing()
+            SessionManager.save_session(processor.config, processor.renamer)
+        #Files that fail, like c.csv with no name column, leave no output in either mode
+        outputs = {}
+        for name in self.FILES:
+            if os.path.exists(f"{prefix}-{name}"):
+                with open(f"{prefix}-{name}", 'rb') as f:
+                    outputs[name] = f.read()
+        with open(f"{prefix}.json", encoding='utf-8') as f:
+            return outputs, f.read()
+
+    def test_worker_output_matches_serial(self):
+        """ Files rewritten by worker processes, and the session saved afterwards, match serial processing byte for byte."""
+        #A single CPU falls back to serial processing, so no pool may start
+        with mock.patch.object(nameswap, "ProcessPoolExecutor", side_effect=AssertionError("pool started")):
+            serial = self._run("serial", 1)
+
+        pool_sizes = []
+        class RecordingPool(nameswap.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                pool_sizes.append(kwargs["max_workers"])
+                super().__init__(*args, **kwargs)
+        with mock.patch.object(nameswap, "ProcessPoolExecutor", RecordingPool):
+            parallel = self._run("parallel", 2)
+
+        self.assertEqual(pool_sizes, [2])
+        self.assertEqual(parallel, serial)
+
+    def test_prime_assigns_names_in_serial_order(self):
+        """ The pre-scan must leave the renamer with the same mappings, in the same order, as processing the files serially."""
+        for rename_whole_cells in (False, True):
+            with self.subTest(rename_whole_cells=rename_whole_cells):
+                serial = _make_processor(["First Name"], rename_whole_cells=rename_whole_cells)
+                for name in sorted(self.FILES):
+                    serial._try_process_file(name, name + ".out")
+                primed = _make_processor(["First Name"], rename_whole_cells=rename_whole_cells)
+                primed._prime_mappings(sorted(self.FILES))
+                self.assertEqual(list(primed.renamer.mappings.items()), list(serial.renamer.mappings.items()))
+
+
+if __name__ == "__main__":
+    unittest.main()